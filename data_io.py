@@ -0,0 +1,121 @@
+# Shared CSV loading for the inflation result pages.
+import csv
+import hashlib
+import os
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional fast path, pandas is used otherwise
+    pa = pacsv = None
+
+# bump whenever the normalized frame changes, so older parquet sidecars miss
+_LOADER_VERSION = 2
+
+# header names (lower-cased) that mark the year column
+_YEAR_KEYS = frozenset({"year", "years", "date", "time", "period"})
+
+def _normalize_year(col):
+    # plain integer years skip the datetime parser entirely
+    arr = col.to_numpy()
+    if np.issubdtype(arr.dtype, np.integer):
+        return pd.Series(arr.astype(np.int32), index=col.index, name=col.name)
+    if pd.api.types.is_datetime64_any_dtype(col):
+        return col.dt.year.astype("Int32")
+    try:
+        return pd.to_numeric(col).astype("Int32")
+    except Exception:
+        # cast to int year if it looks like a date
+        return pd.to_datetime(col, cache=True, errors="coerce").dt.year.astype("Int32")
+
+def _pick_columns(names, path, year_col="Year", value_col=None):
+    # try to find Year, guess first column as Year if not present
+    if year_col not in names:
+        year_col = next((c for c in names if c.lower().strip() in _YEAR_KEYS), names[0])
+
+    # guess value column if not provided
+    if value_col is None:
+        candidates = [c for c in names if c != year_col and c.lower().strip() not in _YEAR_KEYS]
+        if len(candidates) != 1:
+            st.error(f"Please keep exactly two columns in {path}: Year and Value.")
+            st.stop()
+        value_col = candidates[0]
+    return year_col, value_col
+
+def _header_names(path):
+    # header row only; the projected read does the actual parsing
+    if isinstance(path, bytes):
+        line = path.split(b"\n", 1)[0].decode("utf-8-sig")
+    else:
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            line = f.readline()
+    return next(csv.reader([line]), [])
+
+def _read_csv_fast(path, year_col="Year", value_col=None):
+    # only the Year and value columns are parsed; the header row is read on its
+    # own and pyarrow then tokenizes just those two columns on its own threads.
+    # path is a file path or the raw bytes of an upload.
+    label = path if isinstance(path, str) else "the uploaded file"
+    if pacsv is None:
+        df = pd.read_csv(BytesIO(path) if isinstance(path, bytes) else path)
+        year_col, value_col = _pick_columns(list(df.columns), label, year_col, value_col)
+        return df[[year_col, value_col]].copy()
+
+    year_col, value_col = _pick_columns(_header_names(path), label, year_col, value_col)
+    # upload bytes are parsed in place rather than decoded to str first
+    source = pa.BufferReader(path) if isinstance(path, bytes) else path
+    table = pacsv.read_csv(
+        source,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        convert_options=pacsv.ConvertOptions(include_columns=[year_col, value_col]),
+    )
+    return table.select([year_col, value_col]).to_pandas()
+
+def _load_csv(path, year_col="Year", value_col=None):
+    df = _read_csv_fast(path, year_col=year_col, value_col=value_col)
+    df.columns = ["Year", "Value"]
+    df["Year"] = _normalize_year(df["Year"])
+    missing = df["Year"].isna().to_numpy()
+    if missing.any():
+        df = df.iloc[np.flatnonzero(~missing)]
+    # exported series are usually already chronological
+    if not df["Year"].is_monotonic_increasing:
+        df = df.sort_values("Year", kind="stable")
+
+    # annual years fit in int16; values stay float64 so rates like 1.23 display as-is
+    if df["Year"].between(-32768, 32767).all():
+        df = df.astype({"Year": np.int16})
+    return df
+
+@st.cache_data(show_spinner=False, persist="disk")
+def _load_csv_cached(path, year_col, value_col, mtime, version):
+    # mtime and version are part of the cache key, so editing the CSV or the
+    # loader invalidates both caches (Streamlit only hashes this function's source);
+    # the parquet sidecar next to it skips CSV parsing on warm starts. Its name
+    # carries the loader version and the column choice, so a sidecar written by
+    # another loader version or for other columns is never read back.
+    key = hashlib.md5(repr((year_col, value_col)).encode("utf-8")).hexdigest()[:8]
+    cache = f"{path}.v{version}-{key}.parquet"
+    try:
+        if os.path.getmtime(cache) >= mtime:
+            return pd.read_parquet(cache, engine="pyarrow")
+    except Exception:
+        pass
+    df = _load_csv(path, year_col=year_col, value_col=value_col)
+    try:
+        df.to_parquet(cache, engine="pyarrow", compression="zstd")
+    except Exception:
+        pass  # read-only checkout or no pyarrow, the CSV stays the source of truth
+    return df
+
+def load_csv_strict(path, year_col="Year", value_col=None):
+    if isinstance(path, str):
+        return _load_csv_cached(
+            path, year_col, value_col, os.path.getmtime(path), _LOADER_VERSION
+        )
+    return _load_csv(path, year_col=year_col, value_col=value_col)
@@ -1,7 +1,8 @@
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import streamlit as st
-from io import StringIO
+
+from data_io import load_csv_strict
 
 st.set_page_config(page_title="Thailand Inflation – Simple View", layout="centered")
 st.title("Thailand Headline Inflation YoY – Simple Result Page")
@@ -10,33 +11,44 @@ HISTORY_FILE  = "thai_headline_inflation_yoy_annual_yearly.csv"
 FORECAST_FILE = "annual_lstm_forecast.csv"
 
 # --- small helpers ------------------------------------------------------------
-def _normalize_year(col):
-    # cast to int year if it looks like a date
-    try:
-        return pd.to_datetime(col).dt.year
-    except Exception:
-        return pd.to_numeric(col, errors="coerce").astype("Int64")
-
-def load_csv_strict(path, year_col="Year", value_col=None):
-    df = pd.read_csv(path)
-    # try to find Year
-    if year_col not in df.columns:
-        # guess first column as Year if not present
-        df.rename(columns={df.columns[0]: "Year"}, inplace=True)
-    else:
-        df.rename(columns={year_col: "Year"}, inplace=True)
+def _frame_key(df):
+    # Loader frames are a couple of narrow numeric columns, so their raw buffers are
+    # a cheap exact cache key. id() would not do: st.cache_data hands back a fresh
+    # copy on every hit, and a recycled id could serve another frame's chart.
+    return tuple(
+        (name, col.dtype.str, col.to_numpy().tobytes())
+        if isinstance(col.dtype, np.dtype) and col.dtype.kind in "iuf"
+        else (name, pd.util.hash_pandas_object(col, index=False).to_numpy().tobytes())
+        for name, col in df.items()
+    )
 
-    # guess value column if not provided
-    if value_col is None:
-        candidates = [c for c in df.columns if c.lower() not in ("year",)]
-        if len(candidates) != 1:
-            st.error(f"Please keep exactly two columns in {path}: Year and Value.")
-            st.stop()
-        value_col = candidates[0]
+@st.cache_resource(show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+def build_overview_chart(hist_df, fc_df):
+    # the chart spec is shared across reruns; the browser renders it with Vega-Lite
+    import altair as alt
 
-    df.rename(columns={value_col: "Value"}, inplace=True)
-    df["Year"] = _normalize_year(df["Year"])
-    return df.dropna(subset=["Year"]).sort_values("Year")
+    data = pd.concat(
+        [
+            hist_df.rename(columns={"Inflation_YoY": "Value"}),
+            fc_df.rename(columns={"Forecast": "Value"}),
+        ],
+        ignore_index=True,
+    )
+    # history rows come first, so the label is a split at len(hist_df); years can
+    # overlap between the two files, so a searchsorted on Year would not work
+    codes = np.empty(len(data), np.int8)
+    codes[: len(hist_df)] = 0
+    codes[len(hist_df):] = 1
+    data["Series"] = pd.Categorical.from_codes(codes, ["Actual (History)", "Forecast"])
+    base = alt.Chart(data).encode(
+        x=alt.X("Year:Q", axis=alt.Axis(format="d")),
+        y=alt.Y("Value:Q", title="Inflation YoY (%)"),
+        color=alt.Color("Series:N", title=None),
+        tooltip=["Series:N", "Year:Q", alt.Tooltip("Value:Q", format=".2f")],
+    )
+    lines = base.mark_line(strokeWidth=2)
+    points = base.transform_filter(alt.datum.Series == "Forecast").mark_point(filled=True)
+    return (lines + points).properties(height=320)
 
 # --- load data (or allow upload if missing) -----------------------------------
 try:
@@ -46,7 +58,7 @@ except Exception:
     up = st.file_uploader("Upload history CSV (Year, Value)", type=["csv"], key="hist")
     if up is None:
         st.stop()
-    hist_df = load_csv_strict(StringIO(up.getvalue().decode("utf-8")), value_col=None)
+    hist_df = load_csv_strict(up.getvalue(), value_col=None)
 
 try:
     fc_df = load_csv_strict(FORECAST_FILE, value_col=None)
@@ -55,7 +67,7 @@ except Exception:
     up2 = st.file_uploader("Upload forecast CSV (Year, Value)", type=["csv"], key="fc")
     if up2 is None:
         st.stop()
-    fc_df = load_csv_strict(StringIO(up2.getvalue().decode("utf-8")), value_col=None)
+    fc_df = load_csv_strict(up2.getvalue(), value_col=None)
 
 hist_df.rename(columns={"Value": "Inflation_YoY"}, inplace=True)
 fc_df.rename(columns={"Value": "Forecast"}, inplace=True)
@@ -68,13 +80,6 @@ st.dataframe(fc_df, use_container_width=True)
 
 # --- simple combined line chart ----------------------------------------------
 st.subheader("History and Forecast")
-fig, ax = plt.subplots(figsize=(9, 4))
-ax.plot(hist_df["Year"], hist_df["Inflation_YoY"], label="Actual (History)", linewidth=2)
-ax.plot(fc_df["Year"], fc_df["Forecast"], marker="o", label="Forecast", linewidth=2)
-ax.set_xlabel("Year")
-ax.set_ylabel("Inflation YoY (%)")
-ax.grid(True, alpha=0.25)
-ax.legend()
-st.pyplot(fig, clear_figure=True)
+st.altair_chart(build_overview_chart(hist_df, fc_df), use_container_width=True)
 
 st.caption("Tip: Keep CSVs with two columns only. History: Year, Inflation_YoY. Forecast: Year, Forecast.")